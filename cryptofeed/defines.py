@@ -52,7 +52,8 @@ FUNDING = 'funding'
 OPEN_INTEREST = 'open_interest'
 LIQUIDATIONS = 'liquidations'
 FUTURES_INDEX = 'futures_index'
-UNSUPPORTED = 'unsupported'
+# sentinel for unsupported channels/options in the standards mappings, compare with `is`
+UNSUPPORTED = object()
 
 BUY = 'buy'
 SELL = 'sell'
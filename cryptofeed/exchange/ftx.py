@@ -13,7 +13,6 @@ from time import time
 import zlib
 
 import aiohttp
-import pandas as pd
 from sortedcontainers import SortedDict as sd
 from yapic import json
 
@@ -60,11 +60,11 @@ class OKCoin(Feed):
 
         def chan_format(channel, pair):
             if "SWAP" in pair:
-                return channel.format('swap')
-            elif len(pair.split("-")) == 3:
-                return channel.format('futures')
+                return channel.replace('{}', 'swap')
+            elif pair.count("-") == 2:
+                return channel.replace('{}', 'futures')
             else:
-                return channel.format('spot')
+                return channel.replace('{}', 'spot')
 
         if self.config:
             for chan in self.config:
@@ -34,6 +34,10 @@ def gen_pairs(exchange):
         pairs = _exchange_function_map[exchange]()
         LOG.info("%s: %s pairs", exchange, len(pairs))
         _pairs_retrieval_cache[exchange] = pairs
+        if exchange in _exchange_info:
+            # info is complete once the pairs are retrieved, store a plain dict so
+            # lookups of missing keys raise instead of inserting empty entries
+            _exchange_info[exchange] = dict(_exchange_info[exchange])
     return _pairs_retrieval_cache[exchange]
 
 
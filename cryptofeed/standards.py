@@ -10,8 +10,11 @@ between exchanges. These include trading pairs, timestamps, and
 data channel names
 '''
 import logging
-
-import pandas as pd
+import sys
+from datetime import timezone
+from functools import lru_cache
+from itertools import repeat
+from types import MappingProxyType
 
 from cryptofeed.defines import (BINANCE, BINANCE_FUTURES, BINANCE_DELIVERY, BINANCE_US, BITCOINCOM, BITFINEX, BITMAX, BITMEX,
                                 BITSTAMP, BITTREX, BLOCKCHAIN, BYBIT, COINBASE, COINBENE, DERIBIT, EXX, FILL_OR_KILL, FTX,
@@ -22,66 +25,147 @@ from cryptofeed.defines import (BINANCE, BINANCE_FUTURES, BINANCE_DELIVERY, BINA
 from cryptofeed.exceptions import UnsupportedDataFeed, UnsupportedTradingOption, UnsupportedTradingPair
 from cryptofeed.pairs import gen_pairs, _exchange_info
 
+
+try:
+    # optional, parses ISO 8601 strings in C, much faster than pandas
+    from ciso8601 import parse_datetime
+except ImportError:
+    parse_datetime = None
+
 LOG = logging.getLogger('feedhandler')
 
-_std_trading_pairs = {}
 _exchange_to_std = {}
+# (std pair, exchange) -> exchange pair, the only std -> exchange mapping kept
+_pair_lookup = {}
+# every std pair known on at least one exchange
+_std_pairs = set()
+_EMPTY_INFO = {}
+# exchanges that validate trading pairs themselves and use the exchange symbols as-is
+_native_pair_exchanges = frozenset({BITMEX, DERIBIT, KRAKEN_FUTURES})
 
 
 def load_exchange_pair_mapping(exchange: str):
-    if exchange in {BITMEX, DERIBIT, KRAKEN_FUTURES}:
+    if exchange in _native_pair_exchanges:
         return
-    mapping = gen_pairs(exchange)
-    for std, exch in mapping.items():
-        _exchange_to_std[exch] = std
-        if std in _std_trading_pairs:
-            _std_trading_pairs[std][exchange] = exch
-        else:
-            _std_trading_pairs[std] = {exchange: exch}
+    # intern the pair names so the strings handed back to feeds are shared objects
+    # and later lookups keyed on them can short circuit on identity
+    mapping = {sys.intern(std): sys.intern(exch) for std, exch in gen_pairs(exchange).items()}
+    # update from iterators directly, no intermediate dicts
+    _exchange_to_std.update(zip(mapping.values(), mapping))
+    _pair_lookup.update(zip(zip(mapping, repeat(exchange)), mapping.values()))
+    _std_pairs.update(mapping)
+    # new mappings can change lookup results, drop anything already cached
+    pair_std_to_exchange.cache_clear()
+    feed_to_exchange.cache_clear()
+    get_exchange_info.cache_clear()
 
 
+@lru_cache(maxsize=64)
 def get_exchange_info(exchange: str):
+    """
+    Returns the pair mapping and a read only view of the extra exchange
+    info (tick sizes, etc). The view is backed by the module level info,
+    copy it with dict() before modifying it
+    """
     mapping = gen_pairs(exchange)
-    info = dict(_exchange_info.get(exchange, {}))
+    info = MappingProxyType(_exchange_info.get(exchange, _EMPTY_INFO))
     return mapping, info
 
 
+@lru_cache(maxsize=4096)
 def pair_std_to_exchange(pair: str, exchange: str):
     # bitmex does its own validation of trading pairs dynamically
-    if exchange in {BITMEX, DERIBIT, KRAKEN_FUTURES}:
+    if exchange in _native_pair_exchanges:
         return pair
-    if pair in _std_trading_pairs:
-        try:
-            return _std_trading_pairs[pair][exchange]
-        except KeyError:
-            raise UnsupportedTradingPair(f'{pair} is not supported on {exchange}')
-    else:
-        # Bitfinex supports funding pairs that are single currencies, prefixed with f
-        if exchange == BITFINEX and '-' not in pair:
-            return f"f{pair}"
-        raise UnsupportedTradingPair(f'{pair} is not supported on {exchange}')
-
-
-def pair_exchange_to_std(pair):
-    if pair in _exchange_to_std:
-        return _exchange_to_std[pair]
+    ret = _pair_lookup.get((pair, exchange))
+    if ret is not None:
+        return ret
+    # Bitfinex supports funding pairs that are single currencies, prefixed with f
+    if exchange == BITFINEX and '-' not in pair and pair not in _std_pairs:
+        return f"f{pair}"
+    raise UnsupportedTradingPair(f'{pair} is not supported on {exchange}')
+
+
+# _get is bound once at definition time so the per-message call skips the global and attribute lookups
+def pair_exchange_to_std(pair, _get=_exchange_to_std.get):
+    ret = _get(pair)
+    if ret is not None:
+        return ret
     # Bitfinex funding currency
-    if pair[0] == 'f':
+    if pair.startswith('f'):
         return pair[1:]
     return None
 
 
+# exchanges that send numeric timestamps, mapped to the divisor that converts them to seconds
+_ts_divisor = {
+    HUOBI: 1000.0,
+    HUOBI_DM: 1000.0,
+    HUOBI_SWAP: 1000.0,
+    BITFINEX: 1000.0,
+    BYBIT: 1000.0,
+    COINBENE: 1000.0,
+    DERIBIT: 1000.0,
+    BINANCE: 1000.0,
+    BINANCE_US: 1000.0,
+    BINANCE_FUTURES: 1000.0,
+    BINANCE_DELIVERY: 1000.0,
+    GEMINI: 1000.0,
+    BITTREX: 1000.0,
+    BITMAX: 1000.0,
+    KRAKEN_FUTURES: 1000.0,
+    UPBIT: 1000.0,
+    BITSTAMP: 1000000.0
+}
+# exchanges that send timestamps as date strings
+_ts_pd_exchanges = frozenset({BITMEX, COINBASE, HITBTC, OKCOIN, OKEX, FTX, FTX_US, BITCOINCOM, BLOCKCHAIN, PROBIT})
+
+
+def _pd_timestamp(ts):
+    # pandas is slow to import and heavy in memory, only load it once a timestamp needs it
+    import pandas as pd
+    return pd.Timestamp(ts).timestamp()
+
+
+def _iso_to_epoch(ts):
+    if parse_datetime is not None and isinstance(ts, str):
+        # ciso8601 truncates fractions past microseconds, pandas rounds them
+        dot = ts.find('.')
+        if dot != -1 and len(ts) > dot + 7 and ts[dot + 7].isdigit():
+            return _pd_timestamp(ts)
+        try:
+            dt = parse_datetime(ts)
+        except ValueError:
+            return _pd_timestamp(ts)
+        # naive timestamps are UTC, same as pandas
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+    return _pd_timestamp(ts)
+
+
 def timestamp_normalize(exchange, ts):
-    if exchange in {BITMEX, COINBASE, HITBTC, OKCOIN, OKEX, FTX, FTX_US, BITCOINCOM, BLOCKCHAIN, PROBIT}:
-        return pd.Timestamp(ts).timestamp()
-    elif exchange in {HUOBI, HUOBI_DM, HUOBI_SWAP, BITFINEX, BYBIT, COINBENE, DERIBIT, BINANCE, BINANCE_US, BINANCE_FUTURES,
-                      BINANCE_DELIVERY, GEMINI, BITTREX, BITMAX, KRAKEN_FUTURES, UPBIT}:
-        return ts / 1000.0
-    elif exchange in {BITSTAMP}:
-        return ts / 1000000.0
+    divisor = _ts_divisor.get(exchange)
+    if divisor is not None:
+        return ts / divisor
+    if exchange in _ts_pd_exchanges:
+        return _iso_to_epoch(ts)
     return ts
 
 
+def timestamp_normalize_array(exchange, ts):
+    """
+    Normalize a sequence of timestamps from a single exchange in one pass,
+    returns a numpy float64 array of timestamps in seconds
+    """
+    import numpy as np
+
+    divisor = _ts_divisor.get(exchange)
+    if divisor is not None:
+        return np.asarray(ts, dtype=np.float64) / divisor
+    return np.fromiter((timestamp_normalize(exchange, t) for t in ts), dtype=np.float64, count=len(ts))
+
+
 _feed_to_exchange_map = {
     L2_BOOK: {
         BITFINEX: 'book-P0-F0-100',
@@ -245,6 +329,13 @@ _feed_to_exchange_map = {
     }
 }
 
+# the channel map is fixed once the module is loaded, expose it as read only
+_feed_to_exchange_map = MappingProxyType({feed: MappingProxyType(exchanges) for feed, exchanges in _feed_to_exchange_map.items()})
+
+# flattened (exchange, feed) -> channel lookup, unsupported entries are omitted
+_flat_feed = {(exchange, feed): channel for feed, exchanges in _feed_to_exchange_map.items()
+              for exchange, channel in exchanges.items() if channel is not UNSUPPORTED}
+
 _exchange_options = {
     LIMIT: {
         KRAKEN: 'limit',
@@ -282,34 +373,31 @@ _exchange_options = {
     }
 }
 
+# flattened (exchange, option) -> value lookup, unsupported entries are omitted
+_flat_options = {(exchange, option): value for option, exchanges in _exchange_options.items()
+                 for exchange, value in exchanges.items() if value is not UNSUPPORTED}
+
 
 def normalize_trading_options(exchange, option):
-    if option not in _exchange_options:
-        raise UnsupportedTradingOption
-    if exchange not in _exchange_options[option]:
-        raise UnsupportedTradingOption
-
-    ret = _exchange_options[option][exchange]
-    if ret == UNSUPPORTED:
-        raise UnsupportedTradingOption
-    return ret
+    try:
+        return _flat_options[(exchange, option)]
+    except KeyError:
+        raise UnsupportedTradingOption from None
 
 
-def feed_to_exchange(exchange, feed, silent=False):
-    def raise_error():
-        exception = UnsupportedDataFeed(f"{feed} is not currently supported on {exchange}")
-        if not silent:
-            LOG.error("Error: %r", exception)
-        raise exception
+def _raise_unsupported_feed(feed, exchange, silent):
+    exception = UnsupportedDataFeed(f"{feed} is not currently supported on {exchange}")
+    if not silent:
+        LOG.error("Error: %r", exception)
+    raise exception
 
+
+@lru_cache(maxsize=None)
+def feed_to_exchange(exchange, feed, silent=False):
     if exchange == POLONIEX:
         if feed not in _feed_to_exchange_map:
             return pair_std_to_exchange(feed, POLONIEX)
-    try:
-        ret = _feed_to_exchange_map[feed][exchange]
-    except KeyError:
-        raise_error()
-
-    if ret == UNSUPPORTED:
-        raise_error()
+    ret = _flat_feed.get((exchange, feed))
+    if ret is None:
+        _raise_unsupported_feed(feed, exchange, silent)
     return ret
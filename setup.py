@@ -10,6 +10,14 @@ from setuptools import setup
 from setuptools import find_packages
 from setuptools.command.test import test as TestCommand
 
+try:
+    # Optional: when Cython is available the hot path normalization module
+    # is compiled to a C extension, otherwise the pure python module is used.
+    # pip only sees Cython when building with --no-build-isolation, see INSTALL.md
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
 
 def get_long_description():
     """Read the contents of README.md, INSTALL.md and CHANGES.md files."""
@@ -23,6 +31,12 @@ def get_long_description():
     return "\n\n----\n\n".join(markdown)
 
 
+def get_ext_modules():
+    if cythonize is None:
+        return []
+    return cythonize(["cryptofeed/standards.py"], compiler_directives={'language_level': '3'})
+
+
 class Test(TestCommand):
     def run_tests(self):
         import pytest
@@ -47,6 +61,7 @@ setup(
     packages=find_packages(exclude=['tests*']),
     package_data={'': ['rest/config.yaml']},
     cmdclass={'test': Test},
+    ext_modules=get_ext_modules(),
     python_requires='>=3.7',
     classifiers=[
         "Intended Audience :: Developers",
@@ -61,13 +76,15 @@ setup(
         "requests>=2.18.4",
         "websockets>=7.0",
         "sortedcontainers>=1.5.9",
+        "numpy",
         "pandas",
         "aiohttp>=3.7.1",
         "aiofile>=2.0.0",
         "yapic.json>=1.4.3",
-        # Two (optional) dependencies that speed up Cryptofeed:
+        # (Optional) dependencies that speed up Cryptofeed:
         "aiodns>=1.1",  # aiodns speeds up DNS resolving
         "cchardet",     # cchardet is a faster replacement for chardet
+        "ciso8601",     # ciso8601 parses exchange ISO 8601 timestamps much faster than pandas
     ],
     extras_require={
         "rest_api": ["pyyaml"],
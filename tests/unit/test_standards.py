@@ -0,0 +1,170 @@
+'''
+Copyright (C) 2017-2020  Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cryptofeed.defines import (BINANCE, BITFINEX, BITMEX, BITSTAMP, COINBASE, FILL_OR_KILL, GEMINI, KRAKEN, L2_BOOK,
+                                L3_BOOK, LIMIT, MARKET, OKEX, TICKER, TRADES)
+from cryptofeed.exceptions import UnsupportedDataFeed, UnsupportedTradingOption, UnsupportedTradingPair
+from cryptofeed.pairs import _exchange_function_map, _exchange_info, _pairs_retrieval_cache
+from cryptofeed import standards
+from cryptofeed.standards import (_feed_to_exchange_map, _iso_to_epoch, feed_to_exchange, get_exchange_info,
+                                  load_exchange_pair_mapping, normalize_trading_options, pair_exchange_to_std, pair_std_to_exchange,
+                                  timestamp_normalize, timestamp_normalize_array)
+
+
+@pytest.fixture
+def pair_tables():
+    """
+    Restore the module level pair tables after the test. They are restored in place
+    since pair_exchange_to_std holds a bound reference to _exchange_to_std
+    """
+    tables = (standards._exchange_to_std, standards._pair_lookup, standards._std_pairs)
+    saved = [table.copy() for table in tables]
+    yield
+    for table, contents in zip(tables, saved):
+        table.clear()
+        table.update(contents)
+    standards.pair_std_to_exchange.cache_clear()
+    standards.feed_to_exchange.cache_clear()
+    standards.get_exchange_info.cache_clear()
+
+
+def test_pair_mapping(monkeypatch, pair_tables):
+    monkeypatch.setitem(_pairs_retrieval_cache, 'DUMMY', {'BTC-USD': 'BTCUSD', 'ETH-BTC': 'ETHBTC'})
+    monkeypatch.setitem(_pairs_retrieval_cache, BITFINEX, {'BTC-USD': 'tBTCUSD'})
+    load_exchange_pair_mapping('DUMMY')
+    load_exchange_pair_mapping(BITFINEX)
+
+    assert pair_std_to_exchange('BTC-USD', 'DUMMY') == 'BTCUSD'
+    assert pair_std_to_exchange('BTC-USD', BITFINEX) == 'tBTCUSD'
+    assert pair_std_to_exchange('BTC', BITFINEX) == 'fBTC'
+    assert pair_std_to_exchange('XBTUSD', BITMEX) == 'XBTUSD'
+    assert pair_exchange_to_std('ETHBTC') == 'ETH-BTC'
+    assert pair_exchange_to_std('fBTC') == 'BTC'
+    assert pair_exchange_to_std('UNKNOWN') is None
+    assert pair_exchange_to_std('') is None
+
+    with pytest.raises(UnsupportedTradingPair):
+        pair_std_to_exchange('ETH-BTC', BITFINEX)
+    with pytest.raises(UnsupportedTradingPair):
+        pair_std_to_exchange('LTC-USD', 'DUMMY')
+
+
+def test_pair_mapping_reload(monkeypatch, pair_tables):
+    monkeypatch.setitem(_pairs_retrieval_cache, 'DUMMY', {'BTC-USD': 'BTCUSD'})
+    load_exchange_pair_mapping('DUMMY')
+    assert pair_std_to_exchange('BTC-USD', 'DUMMY') == 'BTCUSD'
+
+    monkeypatch.setitem(_pairs_retrieval_cache, 'DUMMY', {'BTC-USD': 'btcusd'})
+    load_exchange_pair_mapping('DUMMY')
+    assert pair_std_to_exchange('BTC-USD', 'DUMMY') == 'btcusd'
+
+
+def test_get_exchange_info(monkeypatch, pair_tables):
+    def dummy_pairs():
+        _exchange_info['DUMMY']['tick_size']['BTC-USD'] = '0.01'
+        return {'BTC-USD': 'BTCUSD'}
+
+    monkeypatch.setitem(_exchange_function_map, 'DUMMY', dummy_pairs)
+    monkeypatch.delitem(_pairs_retrieval_cache, 'DUMMY', raising=False)
+    monkeypatch.setitem(_exchange_info, 'DUMMY', defaultdict(dict))
+
+    mapping, info = get_exchange_info('DUMMY')
+    assert mapping == {'BTC-USD': 'BTCUSD'}
+    assert dict(info) == {'tick_size': {'BTC-USD': '0.01'}}
+    assert get_exchange_info('DUMMY') == (mapping, info)
+    with pytest.raises(TypeError):
+        info['tick_size'] = {}
+    with pytest.raises(KeyError):
+        info['min_size']
+    assert 'min_size' not in _exchange_info['DUMMY']
+
+    monkeypatch.setitem(_pairs_retrieval_cache, 'DUMMY', {'BTC-USD': 'btcusd'})
+    load_exchange_pair_mapping('DUMMY')
+    assert get_exchange_info('DUMMY')[0] == {'BTC-USD': 'btcusd'}
+    assert pair_std_to_exchange('BTC-USD', 'DUMMY') == 'btcusd'
+
+    monkeypatch.setitem(_pairs_retrieval_cache, 'DUMMY_NO_INFO', {})
+    assert dict(get_exchange_info('DUMMY_NO_INFO')[1]) == {}
+
+
+def test_feed_to_exchange():
+    assert feed_to_exchange(COINBASE, L2_BOOK) == 'level2'
+    assert feed_to_exchange(COINBASE, L3_BOOK) == 'full'
+    assert feed_to_exchange(BITMEX, TRADES) == 'trade'
+    assert feed_to_exchange(OKEX, TICKER) == '{}/ticker'
+
+
+def test_feed_to_exchange_unsupported():
+    with pytest.raises(UnsupportedDataFeed):
+        feed_to_exchange(BITMEX, L3_BOOK, silent=True)
+    with pytest.raises(UnsupportedDataFeed):
+        feed_to_exchange(GEMINI, 'not_a_feed', silent=True)
+    with pytest.raises(UnsupportedDataFeed) as e:
+        feed_to_exchange('NOT_AN_EXCHANGE', TRADES, silent=True)
+    assert e.value.__context__ is None
+
+
+def test_feed_to_exchange_map_read_only():
+    with pytest.raises(TypeError):
+        _feed_to_exchange_map[TRADES] = {}
+    with pytest.raises(TypeError):
+        _feed_to_exchange_map[TRADES][COINBASE] = 'trades'
+
+
+def test_normalize_trading_options():
+    assert normalize_trading_options(GEMINI, LIMIT) == 'exchange limit'
+    assert normalize_trading_options(COINBASE, FILL_OR_KILL) == {'time_in_force': 'FOK'}
+
+    with pytest.raises(UnsupportedTradingOption):
+        normalize_trading_options(GEMINI, MARKET)
+    with pytest.raises(UnsupportedTradingOption):
+        normalize_trading_options(KRAKEN, FILL_OR_KILL)
+    with pytest.raises(UnsupportedTradingOption) as e:
+        normalize_trading_options(KRAKEN, 'not_an_option')
+    assert e.value.__suppress_context__
+
+
+def test_timestamp_normalize():
+    assert timestamp_normalize(BINANCE, 1600000000123) == 1600000000.123
+    assert timestamp_normalize(BITSTAMP, 1600000000123456) == 1600000000.123456
+    assert timestamp_normalize(COINBASE, '2020-09-13T12:26:40.123Z') == 1600000000.123
+    assert timestamp_normalize(KRAKEN, 1600000000.123) == 1600000000.123
+
+
+@pytest.mark.parametrize('ts', ['2020-09-13T12:26:40.123Z', '2020-09-13T12:26:40.123456Z', '2020-09-13T12:26:40.123',
+                                '2020-09-13T12:26:40.123456789Z', '2019-03-20T18:16:23.397991+00:00',
+                                '2019-03-20T20:16:23.397991+02:00'])
+def test_iso_to_epoch_matches_pandas(ts):
+    pytest.importorskip('ciso8601')
+    assert _iso_to_epoch(ts) == pd.Timestamp(ts).timestamp()
+
+
+def test_iso_to_epoch_sub_microsecond_uses_pandas(monkeypatch):
+    def parse_datetime(ts):
+        raise AssertionError(f"{ts} should be parsed by pandas")
+
+    monkeypatch.setattr(standards, 'parse_datetime', parse_datetime)
+    assert _iso_to_epoch('2020-09-13T12:26:40.123456789Z') == 1600000000.123457
+    assert _iso_to_epoch('2019-03-20T20:16:23.3979915+02:00') == pd.Timestamp('2019-03-20T20:16:23.3979915+02:00').timestamp()
+
+
+def test_timestamp_normalize_array():
+    ts = [1600000000123, 1600000001456]
+    assert np.array_equal(timestamp_normalize_array(BINANCE, ts), [timestamp_normalize(BINANCE, t) for t in ts])
+    assert np.array_equal(timestamp_normalize_array(BINANCE, np.array(ts)), [1600000000.123, 1600000001.456])
+
+    ts = ['2020-09-13T12:26:40.123Z', '2020-09-13T12:26:41.456Z']
+    assert np.array_equal(timestamp_normalize_array(COINBASE, ts), [1600000000.123, 1600000001.456])
+
+    ts = [1600000000.123, 1600000001.456]
+    assert np.array_equal(timestamp_normalize_array(KRAKEN, ts), ts)
+